@@ -26,9 +26,11 @@ class Settings(BaseSettings):
     db_user: Optional[str] = None
     db_password: Optional[str] = None
     database_pool_size: int = 100  # Increased for better concurrency
+    database_pool_min_size: int = 2  # Connections opened (and kept warm) up front
     database_max_overflow: int = 200  # Increased overflow capacity
     database_query_timeout: int = 3  # Query timeout in seconds
     database_connection_timeout: int = 10  # Connection timeout in seconds
+    health_db_timeout: float = 1.0  # Upper bound on the /health database probe
 
     # Auto-ingest configuration
     auto_ingest_on_start: bool = True
@@ -42,10 +44,14 @@ class Settings(BaseSettings):
     auto_ingest_file_ready_poll_interval: float = 1.0
     auto_ingest_file_ready_stability_checks: int = 2
     auto_ingest_run_periodic_checker: bool = True
+    lazy_background_services: bool = False  # Start monitoring/cleanup on first admin request
     
     # Scheduled cleanup configuration
     enable_scheduled_cleanup: bool = True
     cleanup_interval: int = 600 
+    
+    # Background feedback exports; point every worker at the same directory
+    feedback_export_dir: Optional[str] = None  # Defaults to <tmp>/feedback-exports
 
     # Logging configuration
     log_level: str = "INFO"
@@ -65,6 +71,8 @@ class Settings(BaseSettings):
     enable_query_parallelization: bool = True
     database_query_timeout: int = 3  # Reduced timeout for faster failure
     llm_generation_timeout: int = 15  # Reduced timeout for faster responses
+    rag_top_k: int = 5  # Documents retrieved by the RAG flow probe
+    rag_client_timeout_ms: int = 10000  # Upper bound on a probe retrieval
     
     # Caching optimizations
     enable_embedding_cache: bool = True
@@ -84,6 +92,8 @@ class Settings(BaseSettings):
     cache_max_size: int = 10000
     cache_ttl_seconds: int = 7200  
     enable_response_cache: bool = True
+    enable_semantic_cache: bool = True
+    semantic_cache_threshold: float = 0.92  # Minimum cosine similarity for a semantic hit
 
 
 @lru_cache()
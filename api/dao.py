@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple
+import json
 import threading
+import weakref
 from contextlib import contextmanager
 
 import psycopg2
 import psycopg2.extras
 from psycopg2 import pool
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 from .config import get_settings
 from .models import DocumentResult
 
 
+if orjson is not None:
+    # jsonb columns come back as Python objects; decode them with orjson
+    psycopg2.extras.register_default_jsonb(loads=orjson.loads, globally=True)
+
+
+def _dumps_json(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=str)
+
+
+def as_jsonb(value: Any) -> psycopg2.extras.Json:
+    """Wrap a value for binding to a jsonb parameter."""
+    return psycopg2.extras.Json(value, dumps=_dumps_json)
+
+
 class VectorDAO:
     def __init__(self):
         self.settings = get_settings()
         self._connection_pool: Optional[pool.ThreadedConnectionPool] = None
         self._lock = threading.Lock()
+        # Names of server-side prepared statements per pooled connection
+        self._prepared = weakref.WeakKeyDictionary()
 
     def _get_connection_pool(self) -> pool.ThreadedConnectionPool:
         """Get or create connection pool."""
@@ -37,7 +62,8 @@ class VectorDAO:
                         raise RuntimeError("DATABASE_URL or db_* settings are not configured")
 
                     self._connection_pool = pool.ThreadedConnectionPool(
-                        minconn=1,
+                        minconn=min(self.settings.database_pool_min_size,
+                                    self.settings.database_pool_size),
                         maxconn=self.settings.database_pool_size,
                         dsn=dsn,
                         # Add connection timeout and other optimizations
@@ -57,6 +83,25 @@ class VectorDAO:
             if conn:
                 pool.putconn(conn)
 
+    def execute_prepared(self, cur, name: str, sql: str, params: Sequence[Any] = ()) -> None:
+        """Execute ``sql`` on ``cur`` as a server-side prepared statement.
+
+        The statement is prepared once per pooled connection and re-run with
+        ``EXECUTE`` afterwards, so Postgres skips parse and planning on
+        repeat calls. ``sql`` must use ``$1``-style placeholders.
+        """
+        conn = cur.connection
+        with self._lock:
+            prepared = self._prepared.setdefault(conn, set())
+        if name not in prepared:
+            cur.execute(f"PREPARE {name} AS {sql}")
+            prepared.add(name)
+        if params:
+            placeholders = ", ".join(["%s"] * len(params))
+            cur.execute(f"EXECUTE {name} ({placeholders})", tuple(params))
+        else:
+            cur.execute(f"EXECUTE {name}")
+
     def ensure_schema(self) -> None:
         """Ensure database schema exists."""
         with self.get_connection() as conn:
@@ -127,6 +172,29 @@ class VectorDAO:
                 cur.execute(
                     "CREATE INDEX IF NOT EXISTS idx_documents_source_id ON documents (document_source_id);"
                 )
+                # Semantic response cache: prior query embeddings and their answers
+                cur.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS query_cache_embeddings (
+                      id SERIAL PRIMARY KEY,
+                      query_text TEXT NOT NULL,
+                      system_prompt TEXT NOT NULL DEFAULT '',
+                      model_used TEXT NOT NULL,
+                      embedding vector({self.settings.embedding_dim}) NOT NULL,
+                      response JSONB NOT NULL,
+                      created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    """
+                )
+                # HNSW, unlike ivfflat, needs no rows at build time to place its
+                # lists, and the cache table starts out empty
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_query_cache_embeddings_embedding ON query_cache_embeddings USING hnsw (embedding vector_cosine_ops);"
+                )
+                cur.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_query_cache_embeddings_created_at ON query_cache_embeddings (created_at);"
+                )
+                conn.commit()
 
     def _get_or_create_document_source(self, source_file: Optional[str]) -> Optional[int]:
         """Return document source id, inserting a record if needed."""
@@ -485,6 +553,18 @@ class VectorDAO:
                     ))
                 return results
 
+    def ping(self) -> bool:
+        """Check that a pooled connection is open and answers a trivial query."""
+        with self.get_connection() as conn:
+            if conn.closed:
+                return False
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+                cur.fetchone()
+            # Leave the connection idle rather than inside an open transaction
+            conn.rollback()
+            return True
+
     def count_documents(self) -> int:
         """Count total documents."""
         with self.get_connection() as conn:
@@ -521,6 +601,74 @@ class VectorDAO:
                 row = cur.fetchone()
                 return (row[0], row[1]) if row else None
 
+    def search_semantic_cache(self, query_embedding: List[float], threshold: float,
+                              system_prompt: Optional[str], model: str,
+                              max_age_seconds: int) -> Optional[dict]:
+        """Return the cached response of the nearest prior query, if similar enough.
+
+        Similarity is cosine similarity between query embeddings; only entries
+        for the same system prompt and model, younger than ``max_age_seconds``,
+        are considered.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT response, 1 - (embedding <=> %s::vector) AS similarity
+                    FROM query_cache_embeddings
+                    WHERE system_prompt = %s
+                      AND model_used = %s
+                      AND created_at >= CURRENT_TIMESTAMP - make_interval(secs => %s)
+                    ORDER BY embedding <=> %s::vector
+                    LIMIT 1;
+                    """,
+                    (query_embedding, system_prompt or "", model, max_age_seconds, query_embedding),
+                )
+                row = cur.fetchone()
+                if row and row[1] is not None and float(row[1]) >= threshold:
+                    return row[0]
+                return None
+
+    def put_semantic_cache(self, query_text: str, query_embedding: List[float],
+                           response: dict, system_prompt: Optional[str], model: str,
+                           max_age_seconds: int) -> None:
+        """Store a response in the semantic cache and drop expired entries."""
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "DELETE FROM query_cache_embeddings WHERE created_at < CURRENT_TIMESTAMP - make_interval(secs => %s);",
+                    (max_age_seconds,),
+                )
+                cur.execute(
+                    """
+                    INSERT INTO query_cache_embeddings (query_text, system_prompt, model_used, embedding, response)
+                    VALUES (%s, %s, %s, %s::vector, %s);
+                    """,
+                    (query_text, system_prompt or "", model, query_embedding, as_jsonb(response)),
+                )
+                conn.commit()
+
+    def delete_semantic_cache(self, source_file: Optional[str] = None) -> int:
+        """Delete semantic cache entries, optionally only those citing ``source_file``."""
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                if source_file:
+                    cur.execute(
+                        """
+                        DELETE FROM query_cache_embeddings q
+                        WHERE EXISTS (
+                            SELECT 1 FROM jsonb_array_elements(q.response->'sources') s
+                            WHERE strpos(s->>'source_file', %s) > 0
+                        );
+                        """,
+                        (source_file,),
+                    )
+                else:
+                    cur.execute("DELETE FROM query_cache_embeddings;")
+                deleted_count = cur.rowcount
+                conn.commit()
+                return deleted_count
+
     def close_pool(self):
         """Close the connection pool."""
         if self._connection_pool:
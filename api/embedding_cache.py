@@ -29,9 +29,13 @@ class EmbeddingCache:
     
     def _generate_key(self, text: str, model: str) -> str:
         """Generate cache key from text and model."""
-        # Use shorter hash for memory efficiency
-        content = f"{text}:{model}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        # 128-bit blake2b: compact, fast, and collision-safe at any cache size.
+        # The model name leads, NUL-separated, so a model switch never shares keys.
+        h = hashlib.blake2b(digest_size=16)
+        h.update(model.encode())
+        h.update(b"\0")
+        h.update(text.encode())
+        return h.hexdigest()
     
     def get(self, text: str, model: str) -> Optional[List[float]]:
         """Get cached embedding if available and not expired."""
@@ -3,16 +3,41 @@ Clean, simplified feedback system to avoid syntax issues
 """
 
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .config import get_settings
 from .dao import get_dao
 from .logging_config import get_logger
+from .ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+# How long aggregated feedback stats are reused before re-querying
+STATS_CACHE_TTL_SECONDS = 30.0
+
+# Rows fetched per keyset page when streaming a feedback export
+EXPORT_CHUNK_SIZE = 200
+
+# created_at is nullable, and a NULL in the keyset comparison would end the
+# export early; undated rows sort as the oldest instead
+_EXPORT_SORT_KEY = "COALESCE(created_at, '-infinity'::timestamp)"
+
+_RATING_FILTERS = {
+    "positive": "rating >= 4",
+    "neutral": "rating = 3",
+    "negative": "rating <= 2",
+}
+
+# Feedback has no status column: it counts as addressed once an improvement
+# action references it, and as pending until then
+_STATUS_FILTERS = {
+    "addressed": "EXISTS (SELECT 1 FROM improvement_actions ia WHERE ia.feedback_id = user_feedback.id)",
+    "pending": "NOT EXISTS (SELECT 1 FROM improvement_actions ia WHERE ia.feedback_id = user_feedback.id)",
+}
+
 
 @dataclass
 class SimpleFeedback:
@@ -30,13 +55,32 @@ class SimpleFeedback:
     search_strategy: Optional[str] = None
 
 
+@dataclass(slots=True)
+class FeedbackRow:
+    """Feedback entry as listed by the feedback and admin APIs."""
+    id: int
+    query_text: str
+    response_text: Optional[str]
+    rating: Optional[int]
+    is_accurate: Optional[bool]
+    is_helpful: Optional[bool]
+    comments: Optional[str]
+    user_session: Optional[str]
+    created_at: Optional[datetime]
+
+
 class CleanFeedbackDAO:
     """Clean, simplified feedback DAO."""
     
     def __init__(self):
         self.dao = get_dao()
+        self._stats_cache = TTLCache(STATS_CACHE_TTL_SECONDS)
         self.ensure_table()
     
+    def invalidate_stats(self) -> None:
+        """Drop cached feedback statistics."""
+        self._stats_cache.clear()
+    
     def ensure_table(self):
         """Ensure feedback table exists."""
         try:
@@ -69,6 +113,18 @@ class CleanFeedbackDAO:
                     except Exception:
                         # Column might already exist or not supported
                         pass
+                    
+                    # Lets the windowed rating aggregates run as index-only scans
+                    cur.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_user_feedback_created_at_rating
+                        ON user_feedback (created_at) INCLUDE (rating);
+                    """)
+                    
+                    # Keyset order for exports: (created_at, id) newest first
+                    cur.execute(f"""
+                        CREATE INDEX IF NOT EXISTS idx_user_feedback_created_at_id
+                        ON user_feedback (({_EXPORT_SORT_KEY}) DESC, id DESC);
+                    """)
                     conn.commit()
         except Exception as e:
             logger.error(f"Failed to ensure feedback table: {e}")
@@ -128,14 +184,26 @@ class CleanFeedbackDAO:
                     
                     feedback_id = cur.fetchone()[0]
                     conn.commit()
+                    self.invalidate_stats()
                     return feedback_id
                     
         except Exception as e:
             logger.error(f"Failed to save feedback: {e}")
             raise
     
-    def get_stats(self, days: int = 30) -> Dict[str, Any]:
-        """Get basic feedback statistics."""
+    def get_stats(self, days: int = 30, use_cache: bool = True) -> Dict[str, Any]:
+        """Get basic feedback statistics, reusing results for a short TTL.
+
+        Callers that cache the payload they build from these stats pass
+        ``use_cache=False`` so the two TTLs do not stack.
+        """
+        if not use_cache:
+            return self._query_stats(days)
+        return self._stats_cache.get_or_build_sync(
+            days, lambda: self._query_stats(days), cacheable=lambda stats: 'error' not in stats
+        )
+    
+    def _query_stats(self, days: int) -> Dict[str, Any]:
         try:
             with self.dao.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -194,7 +262,7 @@ class CleanFeedbackDAO:
             logger.error(f"Failed to get feedback stats: {e}")
             return {'error': str(e)}
     
-    def get_recent_feedback(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_feedback(self, limit: int = 10) -> List[FeedbackRow]:
         """Get recent feedback entries."""
         try:
             with self.dao.get_connection() as conn:
@@ -210,20 +278,7 @@ class CleanFeedbackDAO:
                     """, (limit,))
                     
                     rows = cur.fetchall()
-                    return [
-                        {
-                            'id': row[0],
-                            'query_text': row[1],
-                            'response_text': row[2],
-                            'rating': row[3],
-                            'is_accurate': row[4],
-                            'is_helpful': row[5],
-                            'comments': row[6],
-                            'user_session': row[7],
-                            'created_at': row[8].isoformat() if row[8] else None
-                        }
-                        for row in rows
-                    ]
+                    return [FeedbackRow(*row) for row in rows]
         except Exception as e:
             logger.error(f"Failed to get recent feedback: {e}")
             return []
@@ -292,20 +347,7 @@ class CleanFeedbackDAO:
                     """, (limit, offset))
                     
                     rows = cur.fetchall()
-                    feedback_list = [
-                        {
-                            'id': row[0],
-                            'query_text': row[1],
-                            'response_text': row[2],
-                            'rating': row[3],
-                            'is_accurate': row[4],
-                            'is_helpful': row[5],
-                            'comments': row[6],
-                            'user_session': row[7],
-                            'created_at': row[8].isoformat() if row[8] else None
-                        }
-                        for row in rows
-                    ]
+                    feedback_list = [FeedbackRow(*row) for row in rows]
                     
                     return {
                         'feedback': feedback_list,
@@ -319,15 +361,86 @@ class CleanFeedbackDAO:
                 'total': 0,
                 'has_more': False
             }
+    
+    def iter_feedback_export(self, status: Optional[str] = None,
+                             rating_filter: Optional[str] = None,
+                             accuracy_filter: Optional[str] = None,
+                             search: Optional[str] = None,
+                             limit: int = 1000,
+                             chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[tuple]]:
+        """Yield up to ``limit`` feedback export rows in batches of ``chunk_size``.
+        
+        Rows are ``(id, query_text, rating, is_accurate, is_helpful, created_at)``
+        tuples, newest first, with undated rows last. Each batch is a keyset
+        query seeded from the last ``(created_at, id)`` seen, so it seeks on
+        ``idx_user_feedback_created_at_id`` instead of skipping earlier rows.
+        A connection is only held while a batch is being fetched.
+        """
+        where, params = _export_filters(status, rating_filter, accuracy_filter, search)
+        keyset = f"{where} AND" if where else "WHERE"
+        last = None
+        remaining = limit
+        while remaining > 0:
+            batch_size = min(chunk_size, remaining)
+            with self.dao.get_connection() as conn:
+                with conn.cursor() as cur:
+                    if last is None:
+                        cur.execute(f"""
+                            SELECT id, query_text, rating, is_accurate, is_helpful, created_at
+                            FROM user_feedback
+                            {where}
+                            ORDER BY {_EXPORT_SORT_KEY} DESC, id DESC
+                            LIMIT %s;
+                        """, (*params, batch_size))
+                    else:
+                        cur.execute(f"""
+                            SELECT id, query_text, rating, is_accurate, is_helpful, created_at
+                            FROM user_feedback
+                            {keyset} ({_EXPORT_SORT_KEY}, id)
+                                < (COALESCE(%s::timestamp, '-infinity'::timestamp), %s)
+                            ORDER BY {_EXPORT_SORT_KEY} DESC, id DESC
+                            LIMIT %s;
+                        """, (*params, last[5], last[0], batch_size))
+                    rows = cur.fetchall()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < batch_size:
+                return
+            last = rows[-1]
+            remaining -= len(rows)
 
 
-# Global instance
-_clean_feedback_dao: Optional[CleanFeedbackDAO] = None
+def _export_filters(status: Optional[str], rating_filter: Optional[str],
+                    accuracy_filter: Optional[str],
+                    search: Optional[str]) -> Tuple[str, List[Any]]:
+    """Build the WHERE clause and parameters for the feedback export filters.
+    
+    ``status`` takes ``addressed`` or ``pending``; ``rating_filter`` takes ``positive`` (4-5), ``neutral`` (3), ``negative``
+    (1-2) or a single rating; ``accuracy_filter`` takes ``accurate`` or
+    ``inaccurate``; ``search`` matches the query text case-insensitively.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    if status in _STATUS_FILTERS:
+        clauses.append(_STATUS_FILTERS[status])
+    if rating_filter:
+        if rating_filter in _RATING_FILTERS:
+            clauses.append(_RATING_FILTERS[rating_filter])
+        elif rating_filter.isdigit():
+            clauses.append("rating = %s")
+            params.append(int(rating_filter))
+    if accuracy_filter in ("accurate", "inaccurate"):
+        clauses.append("is_accurate = %s")
+        params.append(accuracy_filter == "accurate")
+    if search:
+        clauses.append("query_text ILIKE %s")
+        params.append(f"%{search}%")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
 
 
+@lru_cache()
 def get_clean_feedback_dao() -> CleanFeedbackDAO:
     """Get the clean feedback DAO instance."""
-    global _clean_feedback_dao
-    if _clean_feedback_dao is None:
-        _clean_feedback_dao = CleanFeedbackDAO()
-    return _clean_feedback_dao
\ No newline at end of file
+    return CleanFeedbackDAO()
\ No newline at end of file
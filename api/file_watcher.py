@@ -3,10 +3,11 @@ File watcher for automatic document ingestion.
 Monitors the auto-ingest directory for new files and ingests them automatically.
 """
 
+import os
 import time
 import threading
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, Iterable, Iterator, Set, Optional, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -61,6 +62,69 @@ def _is_file_already_ingested(dao, abs_path: str) -> bool:
             return cur.fetchone() is not None
 
 
+# Supported-file counts per watch path, shared by the status endpoints and
+# refreshed by the periodic checker's own scans
+_file_counts: Dict[str, Tuple[float, Dict[str, int]]] = {}
+_SUPPORTED_EXTENSION_SET = frozenset(SUPPORTED_EXTENSIONS)
+_file_counts_lock = threading.Lock()
+
+
+def _iter_supported_files(watch_path: Path) -> Iterator[str]:
+    """Yield absolute paths of supported files under ``watch_path``.
+
+    A single ``os.scandir`` walk replaces one recursive glob per extension;
+    ``DirEntry`` type checks reuse the data returned by the directory read.
+    """
+    stack = [os.path.abspath(watch_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in _SUPPORTED_EXTENSION_SET:
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _tally_extensions(paths: Iterable[str]) -> Dict[str, int]:
+    counts = dict.fromkeys(SUPPORTED_EXTENSIONS, 0)
+    for path in paths:
+        ext = os.path.splitext(path)[1].lower()
+        if ext in counts:
+            counts[ext] += 1
+    return counts
+
+
+def _scan_file_counts(watch_path: Path) -> Dict[str, int]:
+    """Count supported files under ``watch_path`` in a single directory walk."""
+    return _tally_extensions(_iter_supported_files(watch_path))
+
+
+def _record_file_counts(watch_path: Path, counts: Dict[str, int]) -> None:
+    with _file_counts_lock:
+        _file_counts[str(watch_path)] = (time.monotonic(), counts)
+
+
+def get_cached_file_counts(watch_path: Path, max_age: Optional[float] = None) -> Dict[str, int]:
+    """Return supported-file counts by extension, rescanning at most every ``max_age`` seconds.
+
+    Defaults to the watch interval, so while the periodic checker runs its
+    scans keep the snapshot current and callers never walk the tree.
+    """
+    if max_age is None:
+        max_age = get_settings().auto_ingest_watch_interval
+    key = str(watch_path)
+    with _file_counts_lock:
+        cached = _file_counts.get(key)
+    if cached is not None and time.monotonic() - cached[0] < max_age:
+        return cached[1]
+    counts = _scan_file_counts(watch_path)
+    _record_file_counts(watch_path, counts)
+    return counts
+
+
 class DocumentFileHandler(FileSystemEventHandler):
     """Handle file system events for document ingestion."""
 
@@ -309,9 +373,7 @@ class PeriodicFileChecker:
         if not watch_path.exists():
             return
 
-        for ext in self.supported_extensions:
-            for file_path in watch_path.glob(f"**/*{ext}"):
-                self.known_files.add(str(file_path.absolute()))
+        self.known_files.update(_iter_supported_files(watch_path))
 
     def _check_for_new_files(self):
         """Check for new files and ingest them."""
@@ -319,12 +381,10 @@ class PeriodicFileChecker:
         if not watch_path.exists():
             return
 
-        current_files = set()
-
         # Scan current files
-        for ext in self.supported_extensions:
-            for file_path in watch_path.glob(f"**/*{ext}"):
-                current_files.add(str(file_path.absolute()))
+        current_files = set(_iter_supported_files(watch_path))
+
+        _record_file_counts(watch_path, _tally_extensions(current_files))
 
         dao = get_dao()
         existing_sources = {
@@ -380,6 +440,7 @@ class PeriodicFileChecker:
 # Global instances
 _file_watcher: Optional[FileWatcher] = None
 _periodic_checker: Optional[PeriodicFileChecker] = None
+_monitoring_lock = threading.Lock()
 
 
 def start_file_monitoring():
@@ -438,13 +499,20 @@ def stop_file_monitoring():
     """Stop file monitoring."""
     global _file_watcher, _periodic_checker
 
-    if _file_watcher:
-        _file_watcher.stop()
-        _file_watcher = None
+    # Detach the instances under the lock so concurrent or repeated calls
+    # stop (and join) each of them at most once
+    with _monitoring_lock:
+        file_watcher, _file_watcher = _file_watcher, None
+        periodic_checker, _periodic_checker = _periodic_checker, None
+
+    if file_watcher is None and periodic_checker is None:
+        return
+
+    if file_watcher:
+        file_watcher.stop()
 
-    if _periodic_checker:
-        _periodic_checker.stop()
-        _periodic_checker = None
+    if periodic_checker:
+        periodic_checker.stop()
 
     logger.info("[file-monitor] File monitoring stopped")
 
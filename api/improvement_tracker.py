@@ -3,20 +3,23 @@ Improvement impact tracking and reporting system.
 Tracks improvements made based on feedback and measures their impact.
 """
 
-import json
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+
+import psycopg2.extras
+from psycopg2.extensions import adapt, register_adapter
 
 from .config import get_settings
-from .dao import get_dao
+from .dao import as_jsonb, get_dao
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-class ImprovementType(Enum):
+class ImprovementType(str, Enum):
     SOURCE_BOOST = "source_boost"
     PROMPT_UPDATE = "prompt_update"
     DOCUMENT_UPDATE = "document_update"
@@ -26,7 +29,11 @@ class ImprovementType(Enum):
     OTHER = "other"
 
 
-@dataclass
+# Members are already strings; bind them by value explicitly as well
+register_adapter(ImprovementType, lambda member: adapt(member.value))
+
+
+@dataclass(slots=True)
 class ImprovementAction:
     """Represents an improvement action taken based on feedback."""
     id: Optional[int] = None
@@ -40,7 +47,7 @@ class ImprovementAction:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImpactMetrics:
     """Metrics to measure improvement impact."""
     before_avg_rating: float = 0.0
@@ -93,25 +100,78 @@ class ImprovementTracker:
     
     def record_improvement(self, improvement: ImprovementAction) -> int:
         """Record a new improvement action."""
+        return self.record_improvements_bulk([improvement])[0]
+    
+    def record_improvements_bulk(self, improvements: List[ImprovementAction]) -> List[int]:
+        """Record several improvement actions in one statement and transaction."""
+        if not improvements:
+            return []
+        
+        rows = [
+            (
+                improvement.feedback_id,
+                improvement.action_type,
+                improvement.description,
+                improvement.implemented_at,
+                as_jsonb(improvement.impact_metrics) if improvement.impact_metrics else None,
+                improvement.created_by
+            )
+            for improvement in improvements
+        ]
+        
         with self.dao.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("""
+                results = psycopg2.extras.execute_values(cur, """
                     INSERT INTO improvement_actions (
                         feedback_id, action_type, description, implemented_at,
                         impact_metrics, created_by
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
+                    ) VALUES %s
                     RETURNING id;
-                """, (
-                    improvement.feedback_id,
-                    improvement.action_type.value,
-                    improvement.description,
-                    improvement.implemented_at,
-                    json.dumps(improvement.impact_metrics) if improvement.impact_metrics else None,
-                    improvement.created_by
-                ))
-                improvement_id = cur.fetchone()[0]
+                """, rows, page_size=len(rows), fetch=True)
                 conn.commit()
-                return improvement_id
+                logger.info("Recorded %d improvement actions", len(results))
+                return [row[0] for row in results]
+    
+    def record_feedback_improvements(self, since: datetime, limit: int = 5) -> int:
+        """Record improvement actions for the latest feedback since ``since``.
+        
+        Of the ``limit`` newest entries, those reporting missing information
+        get a document update and those rated 2 or lower a source boost. The
+        rows are generated and inserted by a single statement; returns how
+        many were created.
+        """
+        with self.dao.get_connection() as conn:
+            with conn.cursor() as cur:
+                # Prepared per connection: the recent-feedback scan is a Limit
+                # over the (created_at DESC, id DESC) index, so parsing and
+                # planning were most of the statement's cost
+                self.dao.execute_prepared(cur, "record_feedback_improvements", """
+                    WITH recent AS (
+                        SELECT id, query_text, missing_info, rating
+                        FROM user_feedback
+                        WHERE created_at >= $1
+                        ORDER BY created_at DESC
+                        LIMIT $2
+                    )
+                    INSERT INTO improvement_actions (feedback_id, action_type, description, created_by)
+                    SELECT id, $3::text,
+                           'Added documentation to address missing information about: '
+                               || left(missing_info, 100) || '...',
+                           'admin'
+                    FROM recent
+                    WHERE missing_info <> ''
+                    UNION ALL
+                    SELECT id, $4::text,
+                           'Improved source ranking for queries similar to: '
+                               || left(query_text, 100) || '...',
+                           'system'
+                    FROM recent
+                    WHERE rating <= 2
+                """, (since, limit, ImprovementType.DOCUMENT_UPDATE, ImprovementType.SOURCE_BOOST))
+                created = cur.rowcount
+                conn.commit()
+                logger.info("Recorded %d feedback improvement actions", created)
+                return created
     
     def get_baseline_metrics(self, before_date: datetime, days: int = 7) -> ImpactMetrics:
         """Get baseline metrics before an improvement."""
@@ -142,8 +202,53 @@ class ImprovementTracker:
                     measurement_date=before_date
                 )
     
+    def _get_window_metrics(self, cur, pivot: datetime, days: int,
+                            now: Optional[datetime] = None) -> ImpactMetrics:
+        """Compute before/after metrics around ``pivot`` in a single scan.
+
+        Both windows are aggregated with ``FILTER`` clauses so Postgres reads
+        the ``[pivot - days, pivot + days)`` range of ``user_feedback`` once.
+        The statement is prepared per connection since auto-measurement runs
+        it once per improvement.
+        """
+        before_start = pivot - timedelta(days=days)
+        after_end = pivot + timedelta(days=days)
+        
+        self.dao.execute_prepared(cur, "impact_window_metrics", """
+            SELECT 
+                COUNT(*) FILTER (WHERE created_at < $1),
+                AVG(rating) FILTER (WHERE created_at < $1),
+                COUNT(*) FILTER (WHERE created_at < $1 AND is_accurate = true)::FLOAT / 
+                    NULLIF(COUNT(is_accurate) FILTER (WHERE created_at < $1), 0),
+                COUNT(*) FILTER (WHERE created_at < $1 AND is_helpful = true)::FLOAT / 
+                    NULLIF(COUNT(is_helpful) FILTER (WHERE created_at < $1), 0),
+                COUNT(*) FILTER (WHERE created_at >= $1),
+                AVG(rating) FILTER (WHERE created_at >= $1),
+                COUNT(*) FILTER (WHERE created_at >= $1 AND is_accurate = true)::FLOAT / 
+                    NULLIF(COUNT(is_accurate) FILTER (WHERE created_at >= $1), 0),
+                COUNT(*) FILTER (WHERE created_at >= $1 AND is_helpful = true)::FLOAT / 
+                    NULLIF(COUNT(is_helpful) FILTER (WHERE created_at >= $1), 0)
+            FROM user_feedback 
+            WHERE created_at >= $2 AND created_at < $3
+        """, (pivot, before_start, after_end))
+        
+        row = cur.fetchone()
+        return ImpactMetrics(
+            feedback_count_before=row[0] or 0,
+            before_avg_rating=float(row[1]) if row[1] else 0.0,
+            before_accuracy_rate=float(row[2]) if row[2] else 0.0,
+            before_helpfulness_rate=float(row[3]) if row[3] else 0.0,
+            feedback_count_after=row[4] or 0,
+            after_avg_rating=float(row[5]) if row[5] else 0.0,
+            after_accuracy_rate=float(row[6]) if row[6] else 0.0,
+            after_helpfulness_rate=float(row[7]) if row[7] else 0.0,
+            improvement_period_days=days,
+            measurement_date=now or datetime.now()
+        )
+    
     def measure_improvement_impact(self, improvement_id: int, 
-                                 measurement_period_days: int = 7) -> Optional[ImpactMetrics]:
+                                 measurement_period_days: int = 7,
+                                 now: Optional[datetime] = None) -> Optional[ImpactMetrics]:
         """Measure the impact of an improvement action."""
         with self.dao.get_connection() as conn:
             with conn.cursor() as cur:
@@ -162,52 +267,33 @@ class ImprovementTracker:
                 if not implemented_at:
                     return None
                 
-                # Get baseline metrics (before implementation)
-                baseline = self.get_baseline_metrics(implemented_at, measurement_period_days)
-                
-                # Get post-implementation metrics
-                after_start = implemented_at
-                after_end = implemented_at + timedelta(days=measurement_period_days)
-                
-                cur.execute("""
-                    SELECT 
-                        COUNT(*) as feedback_count,
-                        AVG(rating) as avg_rating,
-                        COUNT(CASE WHEN is_accurate = true THEN 1 END)::FLOAT / 
-                            NULLIF(COUNT(CASE WHEN is_accurate IS NOT NULL THEN 1 END), 0) as accuracy_rate,
-                        COUNT(CASE WHEN is_helpful = true THEN 1 END)::FLOAT / 
-                            NULLIF(COUNT(CASE WHEN is_helpful IS NOT NULL THEN 1 END), 0) as helpfulness_rate
-                    FROM user_feedback 
-                    WHERE created_at >= %s AND created_at < %s;
-                """, (after_start, after_end))
-                
-                after_row = cur.fetchone()
-                
-                impact_metrics = ImpactMetrics(
-                    before_avg_rating=baseline.before_avg_rating,
-                    after_avg_rating=float(after_row[1]) if after_row[1] else 0.0,
-                    before_accuracy_rate=baseline.before_accuracy_rate,
-                    after_accuracy_rate=float(after_row[2]) if after_row[2] else 0.0,
-                    before_helpfulness_rate=baseline.before_helpfulness_rate,
-                    after_helpfulness_rate=float(after_row[3]) if after_row[3] else 0.0,
-                    feedback_count_before=baseline.feedback_count_before,
-                    feedback_count_after=after_row[0] or 0,
-                    improvement_period_days=measurement_period_days,
-                    measurement_date=datetime.now()
+                impact_metrics = self._store_impact(
+                    cur, improvement_id, implemented_at, measurement_period_days, now
                 )
-                
-                # Update the improvement record with impact metrics
-                cur.execute("""
-                    UPDATE improvement_actions 
-                    SET impact_metrics = %s, updated_at = CURRENT_TIMESTAMP
-                    WHERE id = %s;
-                """, (json.dumps(asdict(impact_metrics)), improvement_id))
-                
                 conn.commit()
                 return impact_metrics
     
-    def get_improvement_summary(self, days: int = 30) -> Dict[str, Any]:
+    def _store_impact(self, cur, improvement_id: int, implemented_at: datetime,
+                      measurement_period_days: int,
+                      now: Optional[datetime] = None) -> ImpactMetrics:
+        """Measure an improvement on ``cur`` and save the result to its record."""
+        impact_metrics = self._get_window_metrics(
+            cur, implemented_at, measurement_period_days, now=now
+        )
+        
+        # Update the improvement record with impact metrics
+        cur.execute("""
+            UPDATE improvement_actions 
+            SET impact_metrics = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE id = %s;
+        """, (as_jsonb(asdict(impact_metrics)), improvement_id))
+        return impact_metrics
+    
+    def get_improvement_summary(self, days: int = 30,
+                                now: Optional[datetime] = None) -> Dict[str, Any]:
         """Get summary of improvements and their impact."""
+        cutoff = (now or datetime.now()) - timedelta(days=days)
+        
         with self.dao.get_connection() as conn:
             with conn.cursor() as cur:
                 # Get improvement counts by type
@@ -220,7 +306,7 @@ class ImprovementTracker:
                     WHERE created_at >= %s
                     GROUP BY action_type
                     ORDER BY count DESC;
-                """, (datetime.now() - timedelta(days=days),))
+                """, (cutoff,))
                 
                 improvement_types = {}
                 for row in cur.fetchall():
@@ -241,7 +327,7 @@ class ImprovementTracker:
                     AND implemented_at IS NOT NULL
                     ORDER BY implemented_at DESC
                     LIMIT 10;
-                """, (datetime.now() - timedelta(days=days),))
+                """, (cutoff,))
                 
                 recent_improvements = []
                 total_rating_improvement = 0.0
@@ -249,20 +335,20 @@ class ImprovementTracker:
                 improvements_with_metrics = 0
                 
                 for row in cur.fetchall():
-                    improvement_id, action_type, description, implemented_at, impact_metrics_json, created_by, created_at = row
+                    improvement_id, action_type, description, implemented_at, impact_metrics, created_by, created_at = row
                     
                     improvement_data = {
                         'id': improvement_id,
                         'action_type': action_type,
                         'description': description,
-                        'implemented_at': implemented_at.isoformat() if implemented_at else None,
+                        'implemented_at': implemented_at,
                         'created_by': created_by,
-                        'created_at': created_at.isoformat() if created_at else None,
+                        'created_at': created_at,
                         'impact_metrics': None
                     }
                     
-                    if impact_metrics_json:
-                        impact_metrics = json.loads(impact_metrics_json)
+                    if impact_metrics:
+                        # jsonb columns arrive already decoded
                         improvement_data['impact_metrics'] = impact_metrics
                         
                         # Calculate improvements
@@ -292,30 +378,64 @@ class ImprovementTracker:
                     }
                 }
     
-    def get_improvement_recommendations(self) -> List[Dict[str, Any]]:
+    def get_improvement_recommendations(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Generate improvement recommendations based on feedback patterns."""
         recommendations = []
+        cutoff = (now or datetime.now()) - timedelta(days=14)
         
         with self.dao.get_connection() as conn:
             with conn.cursor() as cur:
-                # Analyze low-rated queries for patterns
+                # Missing-information and search-strategy patterns share one
+                # materialized scan of the recent feedback window
                 cur.execute("""
-                    SELECT 
-                        missing_info,
-                        COUNT(*) as occurrence_count,
-                        AVG(rating) as avg_rating
-                    FROM user_feedback 
-                    WHERE rating <= 3 
-                    AND missing_info IS NOT NULL
-                    AND created_at >= %s
-                    GROUP BY missing_info
-                    HAVING COUNT(*) >= 2
-                    ORDER BY COUNT(*) DESC, AVG(rating) ASC
-                    LIMIT 5;
-                """, (datetime.now() - timedelta(days=14),))
+                    WITH recent AS MATERIALIZED (
+                        SELECT rating, is_accurate, missing_info,
+                               LOWER(missing_info) AS missing_key, search_strategy, created_at
+                        FROM user_feedback 
+                        WHERE created_at >= %s
+                    ),
+                    missing AS (
+                        SELECT 
+                            -- Label with the spelling of the earliest report
+                            (ARRAY_AGG(missing_info ORDER BY created_at))[1] AS label,
+                            COUNT(*) AS occurrence_count,
+                            AVG(rating) AS avg_rating,
+                            NULL::FLOAT AS accuracy_rate,
+                            ROW_NUMBER() OVER (ORDER BY COUNT(*) DESC, AVG(rating) ASC) AS ord
+                        FROM recent 
+                        WHERE rating <= 3 
+                        AND missing_key IS NOT NULL
+                        GROUP BY missing_key
+                        HAVING COUNT(*) >= 2
+                    ),
+                    strategies AS (
+                        SELECT 
+                            search_strategy AS label,
+                            COUNT(*) AS usage_count,
+                            AVG(rating) AS avg_rating,
+                            COUNT(CASE WHEN is_accurate = true THEN 1 END)::FLOAT / 
+                                NULLIF(COUNT(CASE WHEN is_accurate IS NOT NULL THEN 1 END), 0) AS accuracy_rate,
+                            ROW_NUMBER() OVER (ORDER BY AVG(rating) DESC) AS ord
+                        FROM recent 
+                        WHERE search_strategy IS NOT NULL
+                        GROUP BY search_strategy
+                        HAVING COUNT(*) >= 5
+                    )
+                    SELECT 'missing' AS kind, label, occurrence_count, avg_rating, accuracy_rate, ord
+                    FROM missing WHERE ord <= 5
+                    UNION ALL
+                    SELECT 'strategy' AS kind, label, usage_count, avg_rating, accuracy_rate, ord
+                    FROM strategies
+                    ORDER BY kind, ord;
+                """, (cutoff,))
                 
-                for row in cur.fetchall():
-                    missing_info, count, avg_rating = row
+                strategies = []
+                for kind, label, count, avg_rating, accuracy_rate, _ord in cur.fetchall():
+                    if kind == 'strategy':
+                        strategies.append((label, count, avg_rating, accuracy_rate))
+                        continue
+                    
+                    missing_info = label
                     recommendations.append({
                         'type': 'document_update',
                         'priority': 'high' if count >= 5 else 'medium',
@@ -350,7 +470,7 @@ class ImprovementTracker:
                     HAVING COUNT(*) >= 3
                     ORDER BY AVG(rating) DESC, COUNT(*) DESC
                     LIMIT 3;
-                """, (datetime.now() - timedelta(days=14),))
+                """, (cutoff,))
                 
                 for row in cur.fetchall():
                     source_name, count, avg_rating, accuracy_rate = row
@@ -370,22 +490,6 @@ class ImprovementTracker:
                         })
                 
                 # Analyze search strategy effectiveness
-                cur.execute("""
-                    SELECT 
-                        search_strategy,
-                        COUNT(*) as usage_count,
-                        AVG(rating) as avg_rating,
-                        COUNT(CASE WHEN is_accurate = true THEN 1 END)::FLOAT / 
-                            NULLIF(COUNT(CASE WHEN is_accurate IS NOT NULL THEN 1 END), 0) as accuracy_rate
-                    FROM user_feedback 
-                    WHERE search_strategy IS NOT NULL
-                    AND created_at >= %s
-                    GROUP BY search_strategy
-                    HAVING COUNT(*) >= 5
-                    ORDER BY AVG(rating) DESC;
-                """, (datetime.now() - timedelta(days=14),))
-                
-                strategies = cur.fetchall()
                 if len(strategies) > 1:
                     best_strategy = strategies[0]
                     worst_strategy = strategies[-1]
@@ -409,9 +513,11 @@ class ImprovementTracker:
         
         return recommendations
     
-    def auto_measure_recent_improvements(self, days_back: int = 7) -> List[Dict[str, Any]]:
+    def auto_measure_recent_improvements(self, days_back: int = 7,
+                                         now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Automatically measure impact for recent improvements."""
         results = []
+        now = now or datetime.now()
         
         with self.dao.get_connection() as conn:
             with conn.cursor() as cur:
@@ -423,28 +529,34 @@ class ImprovementTracker:
                     AND implemented_at >= %s
                     AND (impact_metrics IS NULL OR impact_metrics = '{}')
                     ORDER BY implemented_at DESC;
-                """, (datetime.now() - timedelta(days=days_back),))
+                """, (now - timedelta(days=days_back),))
                 
                 for row in cur.fetchall():
                     improvement_id, action_type, description, implemented_at = row
                     
                     # Check if enough time has passed for measurement (at least 3 days)
-                    if datetime.now() - implemented_at >= timedelta(days=3):
+                    if now - implemented_at >= timedelta(days=3):
+                        # Measure on the connection already held instead of
+                        # checking out a second one per improvement
                         try:
-                            impact_metrics = self.measure_improvement_impact(improvement_id)
-                            if impact_metrics:
-                                results.append({
-                                    'improvement_id': improvement_id,
-                                    'action_type': action_type,
-                                    'description': description,
-                                    'implemented_at': implemented_at.isoformat(),
-                                    'impact_metrics': asdict(impact_metrics),
-                                    'status': 'measured'
-                                })
-                                logger.info(f"Measured impact for improvement {improvement_id}: "
-                                          f"rating {impact_metrics.before_avg_rating:.2f} -> {impact_metrics.after_avg_rating:.2f}")
+                            impact_metrics = self._store_impact(
+                                cur, improvement_id, implemented_at, 7, now
+                            )
+                            conn.commit()
+                            results.append({
+                                'improvement_id': improvement_id,
+                                'action_type': action_type,
+                                'description': description,
+                                'implemented_at': implemented_at,
+                                'impact_metrics': asdict(impact_metrics),
+                                'status': 'measured'
+                            })
+                            logger.debug("Measured impact for improvement %s: rating %.2f -> %.2f",
+                                         improvement_id, impact_metrics.before_avg_rating,
+                                         impact_metrics.after_avg_rating)
                         except Exception as e:
-                            logger.error(f"Failed to measure impact for improvement {improvement_id}: {e}")
+                            conn.rollback()
+                            logger.error("Failed to measure impact for improvement %s: %s", improvement_id, e)
                             results.append({
                                 'improvement_id': improvement_id,
                                 'action_type': action_type,
@@ -453,16 +565,13 @@ class ImprovementTracker:
                                 'error': str(e)
                             })
         
+        if results:
+            logger.info("Auto-measured %d improvements (%d failed)", len(results),
+                        sum(1 for r in results if r['status'] == 'error'))
         return results
 
 
-# Global instance
-_improvement_tracker: Optional[ImprovementTracker] = None
-
-
+@lru_cache()
 def get_improvement_tracker() -> ImprovementTracker:
     """Get or create the improvement tracker instance."""
-    global _improvement_tracker
-    if _improvement_tracker is None:
-        _improvement_tracker = ImprovementTracker()
-    return _improvement_tracker
\ No newline at end of file
+    return ImprovementTracker()
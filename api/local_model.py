@@ -1,8 +1,13 @@
-from typing import Optional, Dict, Any
+import asyncio
+import time
+from typing import Optional, Dict, Any, List
 import aiohttp
 from .config import get_settings
 from .models import GenerateRequest
 
+# How long a fetched model list is reused by check_model and the status endpoints
+MODELS_CACHE_TTL = 10.0
+
 
 class OllamaError(Exception):
     """Base exception for Ollama-related errors."""
@@ -22,9 +27,14 @@ class GenerationError(OllamaError):
 class LocalLLM:
     """Asynchronous client for local Ollama instance."""
 
-    def __init__(self):
+    def __init__(self, models_ttl: float = MODELS_CACHE_TTL):
         self.settings = get_settings()
         self._session: Optional[aiohttp.ClientSession] = None
+        # The local model list changes rarely; keep it briefly between lookups
+        self.models_ttl = models_ttl
+        self._models: Optional[List[str]] = None
+        self._models_expires_at = 0.0
+        self._models_lock = asyncio.Lock()
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure we have an active aiohttp session."""
@@ -42,14 +52,9 @@ class LocalLLM:
 
     async def check_model(self, model_name: str) -> bool:
         """Check if a model is available locally."""
-        session = await self._ensure_session()
         try:
-            async with session.get(f"{self.settings.ollama_host}/api/tags") as resp:
-                if resp.status != 200:
-                    return False
-                data = await resp.json()
-                return any(model["name"] == model_name for model in data["models"])
-        except aiohttp.ClientError:
+            return model_name in await self.get_models_cached()
+        except OllamaError:
             return False
 
     async def generate(self, request: GenerateRequest, model: Optional[str] = None) -> Dict[str, Any]:
@@ -119,6 +124,19 @@ class LocalLLM:
         except aiohttp.ClientError as e:
             raise OllamaError(f"Failed to communicate with Ollama: {str(e)}")
 
+    async def get_models_cached(self) -> List[str]:
+        """Get the list of available models, refreshing it at most once per TTL."""
+        if time.monotonic() < self._models_expires_at:
+            return self._models
+        async with self._models_lock:
+            # Another caller may have refreshed it while we waited
+            if time.monotonic() < self._models_expires_at:
+                return self._models
+            models = await self.get_models()
+            self._models = models
+            self._models_expires_at = time.monotonic() + self.models_ttl
+            return models
+
 
 # Single instance for the application
 _default_llm: Optional[LocalLLM] = None
@@ -5,16 +5,17 @@ Performance metrics and monitoring for RAG system.
 import time
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
+from collections import defaultdict, deque, namedtuple
 from threading import Lock
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryMetrics:
     """Metrics for a single query."""
     query_id: str
@@ -31,6 +32,15 @@ class QueryMetrics:
     cache_hit: bool = False
 
 
+# Lightweight record with the same fields as QueryMetrics, used by the request
+# hot path; readers access either type by attribute
+QueryMetricsRow = namedtuple("QueryMetricsRow", [
+    "query_id", "query_text", "timestamp", "retrieval_time_ms", "generation_time_ms",
+    "total_time_ms", "documents_retrieved", "strategy_used", "model_used", "success",
+    "error_message", "cache_hit",
+], defaults=(None, False))
+
+
 @dataclass
 class SystemMetrics:
     """Aggregated system metrics."""
@@ -79,6 +89,20 @@ class MetricsCollector:
     
     def record_query(self, metrics: QueryMetrics) -> None:
         """Record metrics for a single query."""
+        self._record(metrics)
+    
+    def record_fast(self, query_id: str, query_text: str, timestamp: float,
+                    retrieval_time_ms: float, generation_time_ms: float, total_time_ms: float,
+                    documents_retrieved: int, strategy_used: str, model_used: str, success: bool,
+                    error_message: Optional[str] = None, cache_hit: bool = False) -> None:
+        """Record metrics for a single query from plain values, skipping the dataclass."""
+        self._record(QueryMetricsRow(
+            query_id, query_text, timestamp, retrieval_time_ms, generation_time_ms,
+            total_time_ms, documents_retrieved, strategy_used, model_used, success,
+            error_message, cache_hit
+        ))
+    
+    def _record(self, metrics) -> None:
         with self.lock:
             # Add to history
             self.query_history.append(metrics)
@@ -211,12 +235,7 @@ class MetricsCollector:
 
 
 # Global metrics collector
-_metrics_collector: Optional[MetricsCollector] = None
-
-
+@lru_cache()
 def get_metrics_collector() -> MetricsCollector:
     """Get or create the metrics collector instance."""
-    global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
\ No newline at end of file
+    return MetricsCollector()
\ No newline at end of file
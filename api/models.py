@@ -32,7 +32,7 @@ class HealthResponse(BaseModel):
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentResult:
     id: int
     content: str
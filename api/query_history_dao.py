@@ -8,7 +8,9 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-from .dao import get_dao
+import psycopg2.extras
+
+from .dao import as_jsonb, get_dao
 
 
 @dataclass
@@ -31,6 +33,28 @@ class QueryRecord:
     updated_at: Optional[datetime] = None
 
 
+@dataclass(slots=True)
+class QueryHistoryRow:
+    """Query history fields exposed by the history API."""
+    id: int
+    query_text: str
+    response_text: Optional[str]
+    sources_used: Optional[List[Dict]]
+    search_type: Optional[str]
+    response_time_ms: Optional[int]
+    success: bool
+    created_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class QuerySearchRow:
+    """Query history fields returned by history search."""
+    id: int
+    query_text: str
+    response_text: Optional[str]
+    created_at: Optional[datetime]
+
+
 class QueryHistoryDAO:
     """Data access object for query history operations."""
     
@@ -84,7 +108,7 @@ class QueryHistoryDAO:
                 """, (
                     record.session_id, record.user_ip, record.user_agent,
                     record.query_text, record.response_text,
-                    json.dumps(record.sources_used) if record.sources_used else None,
+                    as_jsonb(record.sources_used) if record.sources_used else None,
                     record.search_type, record.response_time_ms, record.tokens_used,
                     record.model_used, record.success, record.error_message
                 ))
@@ -92,6 +116,34 @@ class QueryHistoryDAO:
                 conn.commit()
                 return query_id
     
+    def log_query_bulk(self, records: List[QueryRecord]) -> int:
+        """Log several query interactions in one statement and transaction."""
+        if not records:
+            return 0
+        
+        rows = [
+            (
+                record.session_id, record.user_ip, record.user_agent,
+                record.query_text, record.response_text,
+                as_jsonb(record.sources_used) if record.sources_used else None,
+                record.search_type, record.response_time_ms, record.tokens_used,
+                record.model_used, record.success, record.error_message
+            )
+            for record in records
+        ]
+        
+        with self.dao.get_connection() as conn:
+            with conn.cursor() as cur:
+                psycopg2.extras.execute_values(cur, """
+                    INSERT INTO query_history (
+                        session_id, user_ip, user_agent, query_text, response_text,
+                        sources_used, search_type, response_time_ms, tokens_used,
+                        model_used, success, error_message
+                    ) VALUES %s;
+                """, rows, page_size=len(rows))
+                conn.commit()
+                return len(rows)
+    
     def get_recent_queries(self, limit: int = 50, session_id: Optional[str] = None) -> List[QueryRecord]:
         """Get recent queries, optionally filtered by session."""
         with self.dao.get_connection() as conn:
@@ -113,10 +165,40 @@ class QueryHistoryDAO:
                 rows = cur.fetchall()
                 return [self._row_to_record(row) for row in rows]
     
+    def get_recent_query_rows(self, limit: int = 50, session_id: Optional[str] = None) -> List[QueryHistoryRow]:
+        """Get recent queries as API rows, selecting only the exposed columns."""
+        with self.dao.get_connection() as conn:
+            with conn.cursor() as cur:
+                if session_id:
+                    cur.execute("""
+                        SELECT id, query_text, response_text, sources_used, search_type,
+                               response_time_ms, success, created_at
+                        FROM query_history 
+                        WHERE session_id = %s 
+                        ORDER BY created_at DESC 
+                        LIMIT %s;
+                    """, (session_id, limit))
+                else:
+                    cur.execute("""
+                        SELECT id, query_text, response_text, sources_used, search_type,
+                               response_time_ms, success, created_at
+                        FROM query_history 
+                        ORDER BY created_at DESC 
+                        LIMIT %s;
+                    """, (limit,))
+                
+                return [
+                    QueryHistoryRow(
+                        row[0], row[1], row[2], self._load_sources(row[3]),
+                        row[4], row[5], row[6], row[7]
+                    )
+                    for row in cur.fetchall()
+                ]
+    
     def get_query_analytics(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get query analytics for the specified number of days."""
         with self.dao.get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 cur.execute("""
                     SELECT 
                         query_text,
@@ -132,9 +214,7 @@ class QueryHistoryDAO:
                     LIMIT 20;
                 """, (datetime.now() - timedelta(days=days),))
                 
-                columns = ['query_text', 'query_count', 'avg_response_time', 
-                          'success_count', 'error_count', 'last_asked']
-                return [dict(zip(columns, row)) for row in cur.fetchall()]
+                return cur.fetchall()
     
     def get_usage_stats(self, days: int = 7) -> Dict[str, Any]:
         """Get usage statistics for the specified number of days."""
@@ -175,17 +255,32 @@ class QueryHistoryDAO:
                 rows = cur.fetchall()
                 return [self._row_to_record(row) for row in rows]
     
+    def search_query_rows(self, search_term: str, limit: int = 20) -> List[QuerySearchRow]:
+        """Search queries by text content, returning only the exposed columns."""
+        pattern = f"%{search_term}%"
+        with self.dao.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT id, query_text, response_text, created_at
+                    FROM query_history 
+                    WHERE query_text ILIKE %s OR response_text ILIKE %s
+                    ORDER BY created_at DESC 
+                    LIMIT %s;
+                """, (pattern, pattern, limit))
+                
+                return [QuerySearchRow(*row) for row in cur.fetchall()]
+    
+    @staticmethod
+    def _load_sources(sources_data):
+        """Decode the sources_used JSONB column."""
+        # Handle JSONB data - it might already be parsed by psycopg2
+        if isinstance(sources_data, str):
+            return json.loads(sources_data)
+        return sources_data  # Already parsed (or NULL)
+    
     def _row_to_record(self, row) -> QueryRecord:
         """Convert database row to QueryRecord."""
-        # Handle JSONB data - it might already be parsed by psycopg2
-        sources_data = row[6]
-        if sources_data is not None:
-            if isinstance(sources_data, str):
-                sources_used = json.loads(sources_data)
-            else:
-                sources_used = sources_data  # Already parsed
-        else:
-            sources_used = None
+        sources_used = self._load_sources(row[6])
             
         return QueryRecord(
             id=row[0],
@@ -8,6 +8,7 @@ import time
 from typing import List, Tuple, Optional, Dict, Any
 from threading import Lock
 from collections import OrderedDict
+from functools import lru_cache
 
 from .config import get_settings
 from .logging_config import get_logger
@@ -118,14 +119,9 @@ class QueryResultCache:
 
 
 # Global cache instance
-_query_result_cache: Optional[QueryResultCache] = None
-
-
+@lru_cache()
 def get_query_result_cache() -> QueryResultCache:
     """Get or create the query result cache instance."""
-    global _query_result_cache
-    if _query_result_cache is None:
-        settings = get_settings()
-        ttl = getattr(settings, 'query_result_cache_ttl', 300)
-        _query_result_cache = QueryResultCache(ttl_seconds=ttl)
-    return _query_result_cache
\ No newline at end of file
+    settings = get_settings()
+    ttl = getattr(settings, 'query_result_cache_ttl', 300)
+    return QueryResultCache(ttl_seconds=ttl)
\ No newline at end of file
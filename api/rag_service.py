@@ -18,6 +18,12 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Prompt context templates, parsed once at import
+_SOURCE_CHUNK = "[Source {}]{}{}\n{}"
+_PAGE_INFO = " (Page {})"
+_CHUNK_INFO = " (Chunk {})"
+_CONTEXT_SEPARATOR = "\n\n"
+
 
 class SearchStrategy(Enum):
     """Available search strategies."""
@@ -388,14 +394,10 @@ class RAGService:
             # Ensure score is between 0 and 1
             normalized_score = max(0.0, min(1.0, normalized_score))
 
-            # Build source info with metadata
-            source_info = f"[Source {i+1}]"
-            if page_number:
-                source_info += f" (Page {page_number})"
-            if chunk_index is not None:
-                source_info += f" (Chunk {chunk_index + 1})"
-
-            ctx_chunks.append(f"{source_info}\n{content}")
+            # Build the chunk with its source header in a single format
+            page_info = _PAGE_INFO.format(page_number) if page_number else ""
+            chunk_info = _CHUNK_INFO.format(chunk_index + 1) if chunk_index is not None else ""
+            ctx_chunks.append(_SOURCE_CHUNK.format(i + 1, page_info, chunk_info, content))
             sources.append({
                 "id": doc_id,
                 "source_file": display_source,
@@ -552,24 +554,26 @@ class RAGService:
 
     def _truncate_context(self, ctx_chunks: List[str], sources: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
         """Truncate context chunks to fit within max_context_length and align sources."""
-        context_text = "\n\n".join(ctx_chunks)
+        # Size the joined context from chunk lengths so it is only built once
+        lengths = [len(chunk) for chunk in ctx_chunks]
+        joined_length = sum(lengths) + len(_CONTEXT_SEPARATOR) * max(len(ctx_chunks) - 1, 0)
 
         # Ensure context doesn't exceed max length
-        if len(context_text) > self.max_context_length:
+        if joined_length > self.max_context_length:
             # Truncate and keep most relevant sources
-            truncated_chunks: List[str] = []
+            keep = 0
             current_length = 0
 
-            for chunk in ctx_chunks:
-                if current_length + len(chunk) > self.max_context_length:
+            for length in lengths:
+                if current_length + length > self.max_context_length:
                     break
-                truncated_chunks.append(chunk)
-                current_length += len(chunk)
+                keep += 1
+                current_length += length
 
-            context_text = "\n\n".join(truncated_chunks)
-            sources = sources[:len(truncated_chunks)]
+            ctx_chunks = ctx_chunks[:keep]
+            sources = sources[:keep]
 
-        return context_text, sources
+        return _CONTEXT_SEPARATOR.join(ctx_chunks), sources
 
     async def _build_context_async(self, documents: List[DocumentResult], query: str = "") -> Tuple[str, List[Dict[str, Any]]]:
         """Async wrapper for context building to enable parallel processing."""
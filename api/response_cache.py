@@ -5,8 +5,9 @@ Response caching for improved performance and reduced LLM calls.
 import hashlib
 import json
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from threading import Lock
 
 from .config import get_settings
@@ -36,9 +37,13 @@ class CachedResponse:
 class ResponseCache:
     """In-memory response cache with TTL and LRU eviction."""
     
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
+    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600,
+                 semantic_threshold: Optional[float] = None):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
+        # Cosine-similarity threshold for the database-backed semantic tier;
+        # None disables it
+        self.semantic_threshold = semantic_threshold
         self.cache: Dict[str, CachedResponse] = {}
         self.access_order: list = []  # For LRU
         self.lock = Lock()
@@ -47,22 +52,25 @@ class ResponseCache:
         self.hits = 0
         self.misses = 0
         self.evictions = 0
+        self.semantic_hits = 0
+        self.semantic_misses = 0
     
-    def _generate_cache_key(self, query: str, system_prompt: Optional[str] = None, 
-                          model: Optional[str] = None) -> str:
+    def make_key(self, query: str, system_prompt: Optional[str] = None,
+                 model: Optional[str] = None) -> str:
         """Generate cache key from query parameters."""
         # Normalize query for better cache hits
         normalized_query = query.strip().lower()
         
-        # Use simpler hash for better performance
         content = f"{normalized_query}:{system_prompt or ''}:{model or ''}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
     
     def get(self, query: str, system_prompt: Optional[str] = None, 
             model: Optional[str] = None) -> Optional[CachedResponse]:
         """Get cached response if available and not expired."""
-        cache_key = self._generate_cache_key(query, system_prompt, model)
-        
+        return self.get_by_key(self.make_key(query, system_prompt, model))
+    
+    def get_by_key(self, cache_key: str) -> Optional[CachedResponse]:
+        """Get a cached response by a key from ``make_key``."""
         with self.lock:
             if cache_key not in self.cache:
                 self.misses += 1
@@ -87,14 +95,17 @@ class ResponseCache:
             cached_response.hit_count += 1
             self.hits += 1
             
-            logger.debug(f"Cache hit for query: {query[:50]}...")
+            logger.debug(f"Cache hit for key: {cache_key}")
             return cached_response
     
     def put(self, query: str, response_text: str, sources: list, model_used: str,
             system_prompt: Optional[str] = None) -> None:
         """Cache a response."""
-        cache_key = self._generate_cache_key(query, system_prompt, model_used)
-        
+        self.put_by_key(self.make_key(query, system_prompt, model_used),
+                        response_text, sources, model_used)
+    
+    def put_by_key(self, cache_key: str, response_text: str, sources: list, model_used: str) -> None:
+        """Cache a response under a key from ``make_key``."""
         with self.lock:
             # Create cached response
             cached_response = CachedResponse(
@@ -119,7 +130,62 @@ class ResponseCache:
                     del self.cache[oldest_key]
                     self.evictions += 1
             
-            logger.debug(f"Cached response for query: {query[:50]}...")
+            logger.debug(f"Cached response for key: {cache_key}")
+    
+    def get_semantic(self, query_embedding: List[float], system_prompt: Optional[str] = None,
+                     model: Optional[str] = None) -> Optional[CachedResponse]:
+        """Get the cached response of a sufficiently similar earlier query."""
+        if self.semantic_threshold is None:
+            return None
+        
+        try:
+            from .dao import get_dao
+            response = get_dao().search_semantic_cache(
+                query_embedding, self.semantic_threshold, system_prompt,
+                model or "", self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+        
+        with self.lock:
+            if response is None:
+                self.semantic_misses += 1
+                return None
+            self.semantic_hits += 1
+        
+        return CachedResponse(
+            text=response.get('text', ''),
+            sources=response.get('sources') or [],
+            model_used=response.get('model_used', model or ''),
+            timestamp=time.time()
+        )
+    
+    def put_semantic(self, query: str, query_embedding: List[float], response_text: str,
+                     sources: list, model_used: str, system_prompt: Optional[str] = None) -> None:
+        """Store a response in the semantic tier, keyed by its query embedding."""
+        if self.semantic_threshold is None:
+            return
+        
+        try:
+            from .dao import get_dao
+            get_dao().put_semantic_cache(
+                query, query_embedding,
+                {'text': response_text, 'sources': sources or [], 'model_used': model_used},
+                system_prompt, model_used, self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store semantic cache entry: {e}")
+    
+    def _clear_semantic(self, source_file: Optional[str] = None) -> int:
+        if self.semantic_threshold is None:
+            return 0
+        try:
+            from .dao import get_dao
+            return get_dao().delete_semantic_cache(source_file)
+        except Exception as e:
+            logger.warning(f"Failed to clear semantic cache: {e}")
+            return 0
     
     def clear(self) -> None:
         """Clear all cached responses."""
@@ -127,6 +193,7 @@ class ResponseCache:
             self.cache.clear()
             self.access_order.clear()
             logger.info("Response cache cleared")
+        self._clear_semantic()
     
     def invalidate_by_source(self, source_file: str) -> int:
         """Invalidate cached responses that used a specific source file."""
@@ -149,6 +216,8 @@ class ResponseCache:
                     self.access_order.remove(key)
                 invalidated_count += 1
         
+        invalidated_count += self._clear_semantic(source_file)
+        
         if invalidated_count > 0:
             logger.info(f"Invalidated {invalidated_count} cached responses using source: {source_file}")
         
@@ -167,7 +236,10 @@ class ResponseCache:
                 "misses": self.misses,
                 "hit_rate": round(hit_rate, 2),
                 "evictions": self.evictions,
-                "ttl_seconds": self.ttl_seconds
+                "ttl_seconds": self.ttl_seconds,
+                "semantic_cache_enabled": self.semantic_threshold is not None,
+                "semantic_hits": self.semantic_hits,
+                "semantic_misses": self.semantic_misses
             }
     
     def cleanup_expired(self) -> int:
@@ -194,16 +266,17 @@ class ResponseCache:
 
 
 # Global cache instance
-_response_cache: Optional[ResponseCache] = None
-
-
+@lru_cache()
 def get_response_cache() -> ResponseCache:
     """Get or create the response cache instance."""
-    global _response_cache
-    if _response_cache is None:
-        settings = get_settings()
-        # Configure cache based on settings
-        max_size = getattr(settings, 'cache_max_size', 1000)
-        ttl_seconds = getattr(settings, 'cache_ttl_seconds', 3600)
-        _response_cache = ResponseCache(max_size=max_size, ttl_seconds=ttl_seconds)
-    return _response_cache
\ No newline at end of file
+    settings = get_settings()
+    # Configure cache based on settings
+    max_size = getattr(settings, 'cache_max_size', 1000)
+    ttl_seconds = getattr(settings, 'cache_ttl_seconds', 3600)
+    semantic_threshold = (
+        settings.semantic_cache_threshold
+        if settings.enable_semantic_cache and (settings.database_url or settings.db_host)
+        else None
+    )
+    return ResponseCache(max_size=max_size, ttl_seconds=ttl_seconds,
+                         semantic_threshold=semantic_threshold)
\ No newline at end of file
@@ -3,6 +3,7 @@ Scheduled cleanup service for automatic orphaned document removal.
 Runs periodically to clean up documents that no longer exist in the filesystem.
 """
 
+import os
 import time
 import threading
 from pathlib import Path
@@ -91,7 +92,7 @@ class ScheduledCleanupService:
                 
                 # Log the cleaned files for audit purposes
                 for removed_file in removed_files[:5]:  # Log first 5
-                    logger.info(f"[cleanup-service] Removed orphaned file: {Path(removed_file).name}")
+                    logger.info(f"[cleanup-service] Removed orphaned file: {os.path.basename(removed_file)}")
                     
                 if len(removed_files) > 5:
                     logger.info(f"[cleanup-service] ... and {len(removed_files) - 5} more files")
@@ -0,0 +1,115 @@
+"""
+Small keyed TTL cache with single-flight rebuilds.
+
+Used for the short-lived snapshots that dashboards and probes poll (health,
+analytics, telemetry, feedback stats): a stale key is rebuilt by one caller
+while concurrent callers wait for and share its result.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class TTLCache:
+    """Keyed values that expire ``ttl`` seconds after they were stored.
+
+    ``None`` means "not cached", so it cannot be stored as a value. With
+    ``max_entries`` set, the entries stored longest ago are evicted first.
+    Reads and writes are thread-safe.
+    """
+
+    def __init__(self, ttl: float, max_entries: Optional[int] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Builds in progress: futures on the event loop, locks across threads
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._build_locks: Dict[Hashable, list] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """The fresh value cached under ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def get_or_build(self, key: Hashable, build: Callable[[], Awaitable[Any]],
+                           cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Return the cached value, or await ``build()`` once for all callers.
+
+        Callers arriving while a build is running share its result. If that
+        build fails or is cancelled, the next waiter builds instead.
+        ``cacheable`` can veto storing a result (error payloads, say); it is
+        still returned to everyone who waited for it.
+        """
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            await asyncio.wait({pending})
+            if not pending.cancelled():
+                return pending.result()
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await build()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        if cacheable is None or cacheable(value):
+            self.put(key, value)
+        future.set_result(value)
+        return value
+
+    def get_or_build_sync(self, key: Hashable, build: Callable[[], Any],
+                          cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Blocking counterpart of :meth:`get_or_build` for worker threads."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            slot = self._build_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                # Another thread may have stored it while we waited
+                value = self.get(key)
+                if value is not None:
+                    return value
+                value = build()
+                if cacheable is None or cacheable(value):
+                    self.put(key, value)
+                return value
+        finally:
+            # Drop the lock once no thread is building or waiting on this key
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    self._build_locks.pop(key, None)
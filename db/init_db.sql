@@ -39,6 +39,21 @@ CREATE INDEX IF NOT EXISTS idx_documents_source_id ON documents (document_source
 CREATE INDEX IF NOT EXISTS idx_documents_created_at ON documents (created_at);
 CREATE INDEX IF NOT EXISTS idx_documents_file_type ON documents (file_type);
 
+-- Semantic response cache keyed by query embedding
+CREATE TABLE IF NOT EXISTS query_cache_embeddings (
+    id SERIAL PRIMARY KEY,
+    query_text TEXT NOT NULL,
+    system_prompt TEXT NOT NULL DEFAULT '',
+    model_used TEXT NOT NULL,
+    embedding vector(768) NOT NULL,
+    response JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- HNSW rather than ivfflat: the table starts empty, and ivfflat lists built from no rows miss close matches
+CREATE INDEX IF NOT EXISTS idx_query_cache_embeddings_embedding ON query_cache_embeddings USING hnsw (embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_query_cache_embeddings_created_at ON query_cache_embeddings (created_at);
+
 -- Query history table for tracking user interactions
 CREATE TABLE IF NOT EXISTS query_history (
     id SERIAL PRIMARY KEY,
@@ -84,6 +99,10 @@ CREATE TABLE IF NOT EXISTS user_feedback (
 CREATE INDEX IF NOT EXISTS idx_user_feedback_created_at ON user_feedback (created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_user_feedback_rating ON user_feedback (rating);
 CREATE INDEX IF NOT EXISTS idx_user_feedback_user_session ON user_feedback (user_session);
+-- Covers the windowed rating aggregates (feedback impact) with an index-only scan
+CREATE INDEX IF NOT EXISTS idx_user_feedback_created_at_rating ON user_feedback (created_at) INCLUDE (rating);
+-- Keyset pagination order for feedback exports; undated rows sort as the oldest
+CREATE INDEX IF NOT EXISTS idx_user_feedback_created_at_id ON user_feedback ((COALESCE(created_at, '-infinity'::timestamp)) DESC, id DESC);
 
 -- Improvement actions table (used by app.py)
 CREATE TABLE IF NOT EXISTS improvement_actions (
@@ -145,3 +164,4 @@ COMMENT ON TABLE documents IS 'Core document storage with vector embeddings for
 COMMENT ON TABLE query_history IS 'Log of all user queries and system responses for analytics';
 COMMENT ON TABLE user_feedback IS 'User feedback and ratings on system responses';
 COMMENT ON TABLE improvement_actions IS 'Actions taken to improve the system based on feedback';
+COMMENT ON TABLE query_cache_embeddings IS 'Semantic response cache: prior query embeddings and their answers';